@@ -21,22 +21,28 @@ cdef object current_time_millis
 cdef class DNSEntry:
 
     cdef public object key
-    cdef public object name
+    cdef public str name
     cdef public object type
     cdef public object class_
     cdef public object unique
 
+    cdef _fast_init_entry(self, str name, cython.uint type_, cython.uint class_)
+
     cdef _dns_entry_matches(self, DNSEntry other)
 
 cdef class DNSQuestion(DNSEntry):
 
     cdef public cython.int _hash
 
+    cdef _fast_init(self, str name, cython.uint type_, cython.uint class_)
+
 cdef class DNSRecord(DNSEntry):
 
     cdef public cython.float ttl
     cdef public cython.float created
 
+    cdef _fast_init_record(self, str name, cython.uint type_, cython.uint class_, cython.float ttl, cython.float created)
+
     cdef _suppressed_by_answer(self, DNSRecord answer)
 
     @cython.locals(
@@ -57,18 +63,22 @@ cdef class DNSRecord(DNSEntry):
 cdef class DNSAddress(DNSRecord):
 
     cdef public cython.int _hash
-    cdef public object address
+    cdef public bytes address
     cdef public object scope_id
 
+    cdef _fast_init(self, str name, cython.uint type_, cython.uint class_, cython.float ttl, bytes address, object scope_id, cython.float created)
+
     cdef _eq(self, DNSAddress other)
 
 
 cdef class DNSHinfo(DNSRecord):
 
     cdef public cython.int _hash
-    cdef public object cpu
+    cdef public str cpu
     cdef public object os
 
+    cdef _fast_init(self, str name, cython.uint type_, cython.uint class_, cython.float ttl, str cpu, str os, cython.float created)
+
     cdef _eq(self, DNSHinfo other)
 
 
@@ -78,6 +88,8 @@ cdef class DNSPointer(DNSRecord):
     cdef public object alias
     cdef public object alias_key
 
+    cdef _fast_init(self, str name, cython.uint type_, cython.uint class_, cython.float ttl, str alias, cython.float created)
+
     cdef _eq(self, DNSPointer other)
 
 
@@ -86,6 +98,8 @@ cdef class DNSText(DNSRecord):
     cdef public cython.int _hash
     cdef public object text
 
+    cdef _fast_init(self, str name, cython.uint type_, cython.uint class_, cython.float ttl, bytes text, cython.float created)
+
     cdef _eq(self, DNSText other)
 
 
@@ -98,15 +112,19 @@ cdef class DNSService(DNSRecord):
     cdef public object server
     cdef public object server_key
 
+    cdef _fast_init(self, str name, cython.uint type_, cython.uint class_, cython.float ttl, cython.uint priority, cython.uint weight, cython.uint port, str server, cython.float created)
+
     cdef _eq(self, DNSService other)
 
 
 cdef class DNSNsec(DNSRecord):
 
     cdef public cython.int _hash
-    cdef public object next_name
+    cdef public str next_name
     cdef public cython.list rdtypes
 
+    cdef _fast_init(self, str name, cython.uint type_, cython.uint class_, cython.float ttl, str next_name, cython.list rdtypes, cython.float created)
+
     cdef _eq(self, DNSNsec other)
 
 
@@ -42,6 +42,8 @@ _RECENT_TIME_MS = 250
 
 _float = float
 _int = int
+_str = str
+_bytes = bytes
 
 if TYPE_CHECKING:
     from ._protocol.incoming import DNSIncoming
@@ -68,6 +70,10 @@ class DNSEntry:
     __slots__ = ('key', 'name', 'type', 'class_', 'unique')
 
     def __init__(self, name: str, type_: int, class_: int) -> None:
+        self._fast_init_entry(name, type_, class_)
+
+    def _fast_init_entry(self, name: _str, type_: _int, class_: _int) -> None:
+        """Fast init for reuse."""
         self.key = name.lower()
         self.name = name
         self.type = type_
@@ -110,7 +116,11 @@ class DNSQuestion(DNSEntry):
     __slots__ = ('_hash',)
 
     def __init__(self, name: str, type_: int, class_: int) -> None:
-        super().__init__(name, type_, class_)
+        self._fast_init(name, type_, class_)
+
+    def _fast_init(self, name: _str, type_: _int, class_: _int) -> None:
+        """Fast init for reuse."""
+        self._fast_init_entry(name, type_, class_)
         self._hash = hash((self.key, type_, self.class_))
 
     def answered_by(self, rec: 'DNSRecord') -> bool:
@@ -163,9 +173,13 @@ class DNSRecord(DNSEntry):
     def __init__(
         self, name: str, type_: int, class_: int, ttl: Union[float, int], created: Optional[float] = None
     ) -> None:
-        super().__init__(name, type_, class_)
+        self._fast_init_record(name, type_, class_, ttl, created or current_time_millis())
+
+    def _fast_init_record(self, name: _str, type_: _int, class_: _int, ttl: _float, created: _float) -> None:
+        """Fast init for reuse."""
+        self._fast_init_entry(name, type_, class_)
         self.ttl = ttl
-        self.created = created or current_time_millis()
+        self.created = created
 
     def __eq__(self, other: Any) -> bool:  # pylint: disable=no-self-use
         """Abstract method"""
@@ -244,7 +258,20 @@ class DNSAddress(DNSRecord):
         scope_id: Optional[int] = None,
         created: Optional[float] = None,
     ) -> None:
-        super().__init__(name, type_, class_, ttl, created)
+        self._fast_init(name, type_, class_, ttl, address, scope_id, created or current_time_millis())
+
+    def _fast_init(
+        self,
+        name: _str,
+        type_: _int,
+        class_: _int,
+        ttl: _float,
+        address: _bytes,
+        scope_id: Optional[_int],
+        created: _float,
+    ) -> None:
+        """Fast init for reuse."""
+        self._fast_init_record(name, type_, class_, ttl, created)
         self.address = address
         self.scope_id = scope_id
         self._hash = hash((self.key, type_, self.class_, address, scope_id))
@@ -289,7 +316,13 @@ class DNSHinfo(DNSRecord):
     def __init__(
         self, name: str, type_: int, class_: int, ttl: int, cpu: str, os: str, created: Optional[float] = None
     ) -> None:
-        super().__init__(name, type_, class_, ttl, created)
+        self._fast_init(name, type_, class_, ttl, cpu, os, created or current_time_millis())
+
+    def _fast_init(
+        self, name: _str, type_: _int, class_: _int, ttl: _float, cpu: _str, os: _str, created: _float
+    ) -> None:
+        """Fast init for reuse."""
+        self._fast_init_record(name, type_, class_, ttl, created)
         self.cpu = cpu
         self.os = os
         self._hash = hash((self.key, type_, self.class_, cpu, os))
@@ -325,9 +358,15 @@ class DNSPointer(DNSRecord):
     def __init__(
         self, name: str, type_: int, class_: int, ttl: int, alias: str, created: Optional[float] = None
     ) -> None:
-        super().__init__(name, type_, class_, ttl, created)
+        self._fast_init(name, type_, class_, ttl, alias, created or current_time_millis())
+
+    def _fast_init(
+        self, name: _str, type_: _int, class_: _int, ttl: _float, alias: _str, created: _float
+    ) -> None:
+        """Fast init for reuse."""
+        self._fast_init_record(name, type_, class_, ttl, created)
         self.alias = alias
-        self.alias_key = self.alias.lower()
+        self.alias_key = alias.lower()
         self._hash = hash((self.key, type_, self.class_, self.alias_key))
 
     @property
@@ -371,7 +410,13 @@ class DNSText(DNSRecord):
         self, name: str, type_: int, class_: int, ttl: int, text: bytes, created: Optional[float] = None
     ) -> None:
         assert isinstance(text, (bytes, type(None)))
-        super().__init__(name, type_, class_, ttl, created)
+        self._fast_init(name, type_, class_, ttl, text, created or current_time_millis())
+
+    def _fast_init(
+        self, name: _str, type_: _int, class_: _int, ttl: _float, text: _bytes, created: _float
+    ) -> None:
+        """Fast init for reuse."""
+        self._fast_init_record(name, type_, class_, ttl, created)
         self.text = text
         self._hash = hash((self.key, type_, self.class_, text))
 
@@ -416,7 +461,24 @@ class DNSService(DNSRecord):
         server: str,
         created: Optional[float] = None,
     ) -> None:
-        super().__init__(name, type_, class_, ttl, created)
+        self._fast_init(
+            name, type_, class_, ttl, priority, weight, port, server, created or current_time_millis()
+        )
+
+    def _fast_init(
+        self,
+        name: _str,
+        type_: _int,
+        class_: _int,
+        ttl: _float,
+        priority: _int,
+        weight: _int,
+        port: _int,
+        server: _str,
+        created: _float,
+    ) -> None:
+        """Fast init for reuse."""
+        self._fast_init_record(name, type_, class_, ttl, created)
         self.priority = priority
         self.weight = weight
         self.port = port
@@ -470,7 +532,20 @@ class DNSNsec(DNSRecord):
         rdtypes: List[int],
         created: Optional[float] = None,
     ) -> None:
-        super().__init__(name, type_, class_, ttl, created)
+        self._fast_init(name, type_, class_, ttl, next_name, rdtypes, created or current_time_millis())
+
+    def _fast_init(
+        self,
+        name: _str,
+        type_: _int,
+        class_: _int,
+        ttl: _float,
+        next_name: _str,
+        rdtypes: List[_int],
+        created: _float,
+    ) -> None:
+        """Fast init for reuse."""
+        self._fast_init_record(name, type_, class_, ttl, created)
         self.next_name = next_name
         self.rdtypes = sorted(rdtypes)
         self._hash = hash((self.key, type_, self.class_, next_name, *self.rdtypes))
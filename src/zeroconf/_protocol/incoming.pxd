@@ -6,6 +6,9 @@ cdef cython.uint DNS_COMPRESSION_HEADER_LEN
 cdef cython.uint MAX_DNS_LABELS
 cdef cython.uint DNS_COMPRESSION_POINTER_LEN
 cdef cython.uint MAX_NAME_LENGTH
+cdef cython.uint DNS_HEADER_LEN
+cdef cython.uint MIN_QUESTION_LEN
+cdef cython.uint MIN_RECORD_LEN
 
 cdef object current_time_millis
 
@@ -23,10 +26,14 @@ cdef cython.uint _FLAGS_TC
 cdef cython.uint _FLAGS_QR_QUERY
 cdef cython.uint _FLAGS_QR_RESPONSE
 
-cdef object UNPACK_3H
 cdef object UNPACK_6H
 cdef object UNPACK_HH
 cdef object UNPACK_HHiH
+cdef object UNPACK_HHiH3H
+
+cdef cython.set _KNOWN_TYPES
+cdef cython.dict _COMMON_LABELS
+cdef cython.list _BIT_POSITIONS
 
 cdef object DECODE_EXCEPTIONS
 
@@ -51,65 +58,131 @@ cdef class DNSIncoming:
     cdef public unsigned int flags
     cdef cython.uint offset
     cdef public bytes data
+    cdef const unsigned char [:] view
     cdef unsigned int _data_len
     cdef public cython.dict name_cache
     cdef public cython.list questions
     cdef cython.list _answers
-    cdef public object id
+    cdef public cython.uint id
     cdef public cython.uint num_questions
     cdef public cython.uint num_answers
     cdef public cython.uint num_authorities
     cdef public cython.uint num_additionals
-    cdef public object valid
+    cdef public bint valid
     cdef public object now
     cdef public object scope_id
     cdef public object source
 
+    cpdef bint is_query(self)
+
+    cpdef bint is_response(self)
+
     @cython.locals(
         question=DNSQuestion
     )
-    cpdef has_qu_question(self)
+    cpdef bint has_qu_question(self)
 
     @cython.locals(
         off=cython.uint,
+        data=bytes,
+        view="const unsigned char[:]",
+        data_len=cython.uint,
+        name_cache=cython.dict,
+        end_offset=cython.uint,
         label_idx=cython.uint,
+        label=str,
         length=cython.uint,
         link=cython.uint,
-        link_data=cython.uint
+        link_data=cython.uint,
+        seen_pointers=cython.set,
+        pending_links=cython.list,
+        linked_labels=cython.list
     )
-    cdef _decode_labels_at_offset(self, unsigned int off, cython.list labels, cython.set seen_pointers)
+    cdef _decode_labels_at_offset(self, unsigned int off, cython.list labels)
 
     cdef _read_header(self)
 
+    @cython.locals(
+        min_packet_len=cython.ulong
+    )
     cdef _initial_parse(self)
 
     @cython.locals(
         end=cython.uint,
-        length=cython.uint
+        length=cython.uint,
+        type_=cython.uint,
+        class_=cython.uint,
+        ttl=cython.int,
+        n=cython.uint,
+        domain=str,
+        rec=DNSRecord,
+        service_rec=DNSService,
+        data=bytes,
+        view="const unsigned char[:]",
+        data_len=cython.uint,
+        answers=cython.list,
+        offset=cython.uint,
+        name_offset=cython.uint,
+        is_srv=bint,
+        priority=cython.uint,
+        weight=cython.uint,
+        port=cython.uint
     )
     cdef _read_others(self)
 
+    @cython.locals(
+        name=str,
+        type_=cython.uint,
+        class_=cython.uint,
+        question=DNSQuestion,
+        data=bytes,
+        questions=cython.list
+    )
     cdef _read_questions(self)
 
-    cdef bytes _read_character_string(self)
+    @cython.locals(
+        length=cython.uint,
+        start=cython.uint
+    )
+    cdef str _read_character_string(self)
 
-    cdef _read_string(self, unsigned int length)
+    cdef bytes _read_string(self, unsigned int length)
 
     @cython.locals(
-        name_start=cython.uint
+        name_start=cython.uint,
+        address_rec=DNSAddress,
+        pointer_rec=DNSPointer,
+        text_rec=DNSText,
+        nsec_rec=DNSNsec,
+        hinfo_rec=DNSHinfo
     )
-    cdef _read_record(self, object domain, unsigned int type_, object class_, object ttl, unsigned int length)
+    cdef _read_record(self, str domain, unsigned int type_, unsigned int class_, cython.int ttl, unsigned int length)
 
     @cython.locals(
+        rdtypes=cython.list,
+        view="const unsigned char[:]",
         offset=cython.uint,
-        offset_plus_one=cython.uint,
-        offset_plus_two=cython.uint,
+        bitmap_start=cython.uint,
         window=cython.uint,
         bit=cython.uint,
-        byte=cython.uint,
+        byte_base=cython.uint,
         i=cython.uint,
         bitmap_length=cython.uint,
     )
-    cdef _read_bitmap(self, unsigned int end)
+    cdef cython.list _read_bitmap(self, unsigned int end)
 
-    cdef _read_name(self)
+    @cython.locals(
+        labels=cython.list,
+        name_cache=cython.dict,
+        length=cython.uint,
+        original_offset=cython.uint,
+        name=str
+    )
+    cdef str _read_name(self)
+
+    @cython.locals(
+        view="const unsigned char[:]",
+        length=cython.uint,
+        link=cython.uint
+    )
+    cdef unsigned int _skip_name(self, unsigned int off) except? 0
@@ -58,12 +58,31 @@ DNS_COMPRESSION_POINTER_LEN = 2
 MAX_DNS_LABELS = 128
 MAX_NAME_LENGTH = 253
 
+# The header followed by the smallest possible question and resource record,
+# a root name (a single zero byte) and their fixed fields
+DNS_HEADER_LEN = 12
+MIN_QUESTION_LEN = 5
+MIN_RECORD_LEN = 11
+
 DECODE_EXCEPTIONS = (IndexError, struct.error, IncomingDecodeError)
 
-UNPACK_3H = struct.Struct(b'!3H').unpack_from
 UNPACK_6H = struct.Struct(b'!6H').unpack_from
 UNPACK_HH = struct.Struct(b'!HH').unpack_from
 UNPACK_HHiH = struct.Struct(b'!HHiH').unpack_from
+UNPACK_HHiH3H = struct.Struct(b'!HHiH3H').unpack_from
+
+# Record types _read_record can decode, all others are skipped by _read_others.
+# Keep in sync with the branches of _read_record, which assumes HINFO for the last one.
+_KNOWN_TYPES = {_TYPE_A, _TYPE_CNAME, _TYPE_PTR, _TYPE_TXT, _TYPE_SRV, _TYPE_HINFO, _TYPE_AAAA, _TYPE_NSEC}
+
+# Labels found in nearly every mDNS packet share one str across packets
+_COMMON_LABELS: Dict[str, str] = {
+    label: sys.intern(label)
+    for label in ('local', '_tcp', '_udp', '_services', '_dns-sd', '_sub', 'arpa', 'in-addr', 'ip6')
+}
+
+# The set bits of every possible NSEC bitmap byte, most significant bit first
+_BIT_POSITIONS = [tuple(bit for bit in range(8) if value & (0x80 >> bit)) for value in range(256)]
 
 _seen_logs: Dict[str, Union[int, tuple]] = {}
 _str = str
@@ -78,6 +97,7 @@ class DNSIncoming:
         'flags',
         'offset',
         'data',
+        'view',
         '_data_len',
         'name_cache',
         'questions',
@@ -104,8 +124,9 @@ class DNSIncoming:
         self.flags = 0
         self.offset = 0
         self.data = data
+        self.view = data
         self._data_len = len(data)
-        self.name_cache: Dict[int, List[str]] = {}
+        self.name_cache: Optional[Dict[int, List[str]]] = None
         self.questions: List[DNSQuestion] = []
         self._answers: List[DNSRecord] = []
         self.id = 0
@@ -154,6 +175,21 @@ class DNSIncoming:
     def _initial_parse(self) -> None:
         """Parse the data needed to initalize the packet object."""
         self._read_header()
+        min_packet_len = (
+            DNS_HEADER_LEN
+            + MIN_QUESTION_LEN * self.num_questions
+            + MIN_RECORD_LEN * (self.num_answers + self.num_authorities + self.num_additionals)
+        )
+        if min_packet_len > self._data_len:
+            # Nothing past the header can be trusted, do not let answers parse it later
+            self._did_read_others = True
+            raise IncomingDecodeError(
+                f"Packet of {self._data_len} bytes is too short for its section counts from {self.source}"
+            )
+        if self.num_questions > 1 or self.num_answers or self.num_authorities or self.num_additionals:
+            # A lone question is the only name in the packet so
+            # there is nothing for a compression pointer to reuse
+            self.name_cache = {}
         self._read_questions()
         if not self.num_questions:
             self._read_others()
@@ -214,23 +250,27 @@ class DNSIncoming:
             self.num_answers,
             self.num_authorities,
             self.num_additionals,
-        ) = UNPACK_6H(self.data)
-        self.offset += 12
+        ) = UNPACK_6H(self.data, 0)
+        self.offset = DNS_HEADER_LEN
 
     def _read_questions(self) -> None:
         """Reads questions section of packet"""
+        data = self.data
+        questions = self.questions
         for _ in range(self.num_questions):
             name = self._read_name()
-            type_, class_ = UNPACK_HH(self.data, self.offset)
+            type_, class_ = UNPACK_HH(data, self.offset)
             self.offset += 4
-            question = DNSQuestion(name, type_, class_)
-            self.questions.append(question)
+            question = DNSQuestion.__new__(DNSQuestion)
+            question._fast_init(name, type_, class_)
+            questions.append(question)
 
-    def _read_character_string(self) -> bytes:
+    def _read_character_string(self) -> str:
         """Reads a character string from the packet"""
-        length = self.data[self.offset]
-        self.offset += 1
-        return self._read_string(length)
+        length = self.view[self.offset]
+        start = self.offset + 1
+        self.offset = start + length
+        return self.data[start : self.offset].decode('utf-8', 'replace')
 
     def _read_string(self, length: _int) -> bytes:
         """Reads a string of a given length from the packet"""
@@ -242,15 +282,40 @@ class DNSIncoming:
         """Reads the answers, authorities and additionals section of the
         packet"""
         self._did_read_others = True
+        data = self.data
+        view = self.view
+        data_len = self._data_len
+        answers = self._answers
         n = self.num_answers + self.num_authorities + self.num_additionals
         for _ in range(n):
+            name_offset = self.offset
+            offset = self._skip_name(name_offset)
+            # SRV records are in every service response, their priority, weight
+            # and port directly follow the record header so read them together
+            is_srv = not view[offset] and view[offset + 1] == _TYPE_SRV and offset + 16 <= data_len
+            if is_srv:
+                type_, class_, ttl, length, priority, weight, port = UNPACK_HHiH3H(data, offset)
+            else:
+                type_, class_, ttl, length = UNPACK_HHiH(data, offset)
+            if type_ not in _KNOWN_TYPES:
+                # Skip records of types we don't know about without decoding their name
+                self.offset = offset + 10 + length
+                continue
+            self.offset = name_offset
             domain = self._read_name()
-            type_, class_, ttl, length = UNPACK_HHiH(self.data, self.offset)
-            self.offset += 10
+            self.offset = offset + 10
             end = self.offset + length
             rec = None
             try:
-                rec = self._read_record(domain, type_, class_, ttl, length)
+                if is_srv:
+                    self.offset += 6
+                    service_rec = DNSService.__new__(DNSService)
+                    service_rec._fast_init(
+                        domain, type_, class_, ttl, priority, weight, port, self._read_name(), self.now
+                    )
+                    rec = service_rec
+                else:
+                    rec = self._read_record(domain, type_, class_, ttl, length)
             except DECODE_EXCEPTIONS:
                 # Skip records that fail to decode if we know the length
                 # If the packet is really corrupt read_name and the unpack
@@ -261,56 +326,41 @@ class DNSIncoming:
                     domain,
                     _TYPES.get(type_, type_),
                     self.offset,
-                    self.data,
+                    data,
                     exc_info=True,
                 )
             if rec is not None:
-                self._answers.append(rec)
+                answers.append(rec)
 
     def _read_record(
         self, domain: _str, type_: _int, class_: _int, ttl: _int, length: _int
-    ) -> Optional[DNSRecord]:
-        """Read known records types and skip unknown ones."""
+    ) -> DNSRecord:
+        """Read a record of one of the _KNOWN_TYPES."""
+        # Records are built with __new__ and _fast_init to skip
+        # the argument handling in their __init__
         if type_ == _TYPE_A:
-            dns_address = DNSAddress(domain, type_, class_, ttl, self._read_string(4))
-            dns_address.created = self.now
-            return dns_address
+            address_rec = DNSAddress.__new__(DNSAddress)
+            address_rec._fast_init(domain, type_, class_, ttl, self._read_string(4), None, self.now)
+            return address_rec
         if type_ in (_TYPE_CNAME, _TYPE_PTR):
-            return DNSPointer(domain, type_, class_, ttl, self._read_name(), self.now)
+            pointer_rec = DNSPointer.__new__(DNSPointer)
+            pointer_rec._fast_init(domain, type_, class_, ttl, self._read_name(), self.now)
+            return pointer_rec
         if type_ == _TYPE_TXT:
-            return DNSText(domain, type_, class_, ttl, self._read_string(length), self.now)
+            text_rec = DNSText.__new__(DNSText)
+            text_rec._fast_init(domain, type_, class_, ttl, self._read_string(length), self.now)
+            return text_rec
         if type_ == _TYPE_SRV:
-            priority, weight, port = UNPACK_3H(self.data, self.offset)
-            self.offset += 6
-            return DNSService(
-                domain,
-                type_,
-                class_,
-                ttl,
-                priority,
-                weight,
-                port,
-                self._read_name(),
-                self.now,
-            )
-        if type_ == _TYPE_HINFO:
-            return DNSHinfo(
-                domain,
-                type_,
-                class_,
-                ttl,
-                self._read_character_string().decode('utf-8', 'replace'),
-                self._read_character_string().decode('utf-8', 'replace'),
-                self.now,
-            )
+            # _read_others decodes SRV records that fit in the packet
+            raise IncomingDecodeError(f"SRV record at {self.offset} is truncated from {self.source}")
         if type_ == _TYPE_AAAA:
-            dns_address = DNSAddress(domain, type_, class_, ttl, self._read_string(16))
-            dns_address.created = self.now
-            dns_address.scope_id = self.scope_id
-            return dns_address
+            address_rec = DNSAddress.__new__(DNSAddress)
+            address_rec._fast_init(domain, type_, class_, ttl, self._read_string(16), self.scope_id, self.now)
+            return address_rec
         if type_ == _TYPE_NSEC:
             name_start = self.offset
-            return DNSNsec(
+            nsec_rec = DNSNsec.__new__(DNSNsec)
+            nsec_rec._fast_init(
                 domain,
                 type_,
                 class_,
@@ -319,36 +369,80 @@ class DNSIncoming:
                 self._read_bitmap(name_start + length),
                 self.now,
             )
-        # Try to ignore types we don't know about
-        # Skip the payload for the resource record so the next
-        # records can be parsed correctly
-        self.offset += length
-        return None
+            return nsec_rec
+        # _TYPE_HINFO is the only type left in _KNOWN_TYPES
+        hinfo_rec = DNSHinfo.__new__(DNSHinfo)
+        hinfo_rec._fast_init(
+            domain,
+            type_,
+            class_,
+            ttl,
+            self._read_character_string(),
+            self._read_character_string(),
+            self.now,
+        )
+        return hinfo_rec
 
     def _read_bitmap(self, end: _int) -> List[int]:
         """Reads an NSEC bitmap from the packet."""
-        rdtypes = []
-        while self.offset < end:
-            offset = self.offset
-            offset_plus_one = offset + 1
-            offset_plus_two = offset + 2
-            window = self.data[offset]
-            bitmap_length = self.data[offset_plus_one]
-            bitmap_end = offset_plus_two + bitmap_length
-            for i, byte in enumerate(self.data[offset_plus_two:bitmap_end]):
-                for bit in range(0, 8):
-                    if byte & (0x80 >> bit):
-                        rdtypes.append(bit + window * 256 + i * 8)
-            self.offset += 2 + bitmap_length
+        rdtypes: List[int] = []
+        view = self.view
+        offset = self.offset
+        while offset < end:
+            window = view[offset]
+            bitmap_length = view[offset + 1]
+            bitmap_start = offset + 2
+            for i in range(bitmap_length):
+                byte_base = window * 256 + i * 8
+                for bit in _BIT_POSITIONS[view[bitmap_start + i]]:
+                    rdtypes.append(byte_base + bit)
+            offset = bitmap_start + bitmap_length
+        self.offset = offset
         return rdtypes
 
+    def _skip_name(self, off: _int) -> int:
+        """Return the offset after the name at off without decoding it."""
+        view = self.view
+        while True:
+            length = view[off]
+            if length == 0:
+                return off + DNS_COMPRESSION_HEADER_LEN
+            if length < 0x40:
+                off += DNS_COMPRESSION_HEADER_LEN + length
+                continue
+            if length < 0xC0:
+                raise IncomingDecodeError(
+                    f"DNS compression type {length} is unknown at {off} from {self.source}"
+                )
+            link = (length & 0x3F) * 256 + view[off + 1]
+            if link >= self._data_len:
+                raise IncomingDecodeError(
+                    f"DNS compression pointer at {off} points to {link} beyond packet from {self.source}"
+                )
+            return off + DNS_COMPRESSION_POINTER_LEN
+
     def _read_name(self) -> str:
         """Reads a domain name from the packet."""
-        labels: List[str] = []
-        seen_pointers: Set[int] = set()
         original_offset = self.offset
-        self.offset = self._decode_labels_at_offset(original_offset, labels, seen_pointers)
-        self.name_cache[original_offset] = labels
+        name_cache = self.name_cache
+        labels: Optional[List[str]] = None
+        length = self.view[original_offset]
+        if length >= 0xC0 and name_cache is not None:
+            # Most record names are a single pointer to a name that was already
+            # decoded, share the cached labels instead of copying them
+            labels = name_cache.get((length & 0x3F) * 256 + self.view[original_offset + 1])
+        if labels:
+            self.offset = original_offset + DNS_COMPRESSION_POINTER_LEN
+        else:
+            labels = []
+            self.offset = self._decode_labels_at_offset(original_offset, labels)
+        if name_cache is not None:
+            name_cache[original_offset] = labels
+        # Every label is at least one character followed by a dot
+        if len(labels) * 2 > MAX_NAME_LENGTH:
+            raise IncomingDecodeError(
+                f"DNS name with {len(labels)} labels exceeds maximum length of {MAX_NAME_LENGTH} from {self.source}"
+            )
         name = ".".join(labels) + "."
         if len(name) > MAX_NAME_LENGTH:
             raise IncomingDecodeError(
@@ -356,16 +450,35 @@ class DNSIncoming:
             )
         return name
 
-    def _decode_labels_at_offset(self, off: _int, labels: List[str], seen_pointers: Set[int]) -> int:
+    def _decode_labels_at_offset(self, off: _int, labels: List[str]) -> int:
+        """Decode the labels at off into labels and return the offset after the name."""
         # This is a tight loop that is called frequently, small optimizations can make a difference.
-        while off < self._data_len:
-            length = self.data[off]
+        data = self.data
+        view = self.view
+        data_len = self._data_len
+        name_cache = self.name_cache
+        end_offset = 0
+        seen_pointers: Set[int] = set()
+        # Pairs of pointer target and the index into labels its suffix starts at
+        pending_links: List[Tuple[int, int]] = []
+        while off < data_len:
+            length = view[off]
             if length == 0:
-                return off + DNS_COMPRESSION_HEADER_LEN
+                if not end_offset:
+                    end_offset = off + DNS_COMPRESSION_HEADER_LEN
+                break
 
             if length < 0x40:
                 label_idx = off + DNS_COMPRESSION_HEADER_LEN
-                labels.append(self.data[label_idx : label_idx + length].decode('utf-8', 'replace'))
+                try:
+                    # Strict decoding skips the error handler setup and
+                    # takes the ascii fast path for typical mDNS labels.
+                    # When compiled, cython decodes straight from the
+                    # packet buffer without creating a bytes slice.
+                    label = data[label_idx : label_idx + length].decode()
+                except UnicodeDecodeError:
+                    label = data[label_idx : label_idx + length].decode('utf-8', 'replace')
+                labels.append(_COMMON_LABELS.get(label, label))
                 off += DNS_COMPRESSION_HEADER_LEN + length
                 continue
 
@@ -375,10 +488,10 @@ class DNSIncoming:
                 )
 
             # We have a DNS compression pointer
-            link_data = self.data[off + 1]
+            link_data = view[off + 1]
             link = (length & 0x3F) * 256 + link_data
-            lint_int = int(link)
-            if link > self._data_len:
+            link_int = int(link)
+            if link > data_len:
                 raise IncomingDecodeError(
                     f"DNS compression pointer at {off} points to {link} beyond packet from {self.source}"
                 )
@@ -386,21 +499,29 @@ class DNSIncoming:
                 raise IncomingDecodeError(
                     f"DNS compression pointer at {off} points to itself from {self.source}"
                 )
-            if lint_int in seen_pointers:
+            if link_int in seen_pointers:
                 raise IncomingDecodeError(
                     f"DNS compression pointer at {off} was seen again from {self.source}"
                 )
-            linked_labels = self.name_cache.get(lint_int)
-            if not linked_labels:
-                linked_labels = []
-                seen_pointers.add(lint_int)
-                self._decode_labels_at_offset(link, linked_labels, seen_pointers)
-                self.name_cache[lint_int] = linked_labels
-            labels.extend(linked_labels)
+            if not end_offset:
+                # The name ends in the packet after the first pointer
+                end_offset = off + DNS_COMPRESSION_POINTER_LEN
+            linked_labels = name_cache.get(link_int) if name_cache is not None else None
+            if linked_labels:
+                labels.extend(linked_labels)
             if len(labels) > MAX_DNS_LABELS:
                 raise IncomingDecodeError(
                     f"Maximum dns labels reached while processing pointer at {off} from {self.source}"
                 )
-            return off + DNS_COMPRESSION_POINTER_LEN
-
-        raise IncomingDecodeError(f"Corrupt packet received while decoding name from {self.source}")
+            if linked_labels:
+                break
+            seen_pointers.add(link_int)
+            pending_links.append((link_int, len(labels)))
+            off = link
+        else:
+            raise IncomingDecodeError(f"Corrupt packet received while decoding name from {self.source}")
+
+        if name_cache is not None:
+            for link_int, label_idx in pending_links:
+                name_cache[link_int] = labels[label_idx:]
+        return end_offset
@@ -773,6 +773,112 @@ def test_parse_packet_with_nsec_record():
     assert nsec_record.next_name == "MyHome54 (2)._meshcop._udp.local."
 
 
+def test_parse_packet_with_nsec_record_multiple_windows():
+    """Test we can parse an NSEC record with a bitmap spanning more than one window."""
+    nsec_packet = (
+        b"\x00\x00\x84\x00\x00\x00\x00\x01\x00\x00\x00\x00\x04test\x05local\x00\x00/\x80\x01"
+        b"\x00\x00\x00x\x00\x0b\xc0\x0c\x00\x04@\x00\x00\x08\x01\x01@"
+    )
+    parsed = DNSIncoming(nsec_packet)
+    nsec_record = cast(r.DNSNsec, parsed.answers[0])
+    assert nsec_record.rdtypes == [const._TYPE_A, const._TYPE_AAAA, 257]
+    assert nsec_record.next_name == "test.local."
+
+
+def test_invalid_utf8_label_is_replaced():
+    """Test labels that are not valid utf-8 are decoded with replacement characters."""
+    packet = b"\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x03a\xffb\x05local\x00\x00\x01\x00\x01"
+    parsed = DNSIncoming(packet)
+    assert parsed.valid is True
+    assert parsed.questions[0].name == "a\ufffdb.local."
+
+
+def test_common_labels_are_shared():
+    """Test common labels decode to the same str objects across packets."""
+    out = r.DNSOutgoing(const._FLAGS_QR_QUERY)
+    out.add_question(r.DNSQuestion("_hap._tcp.local.", const._TYPE_PTR, const._CLASS_IN))
+    out.add_question(r.DNSQuestion("_airplay._tcp.local.", const._TYPE_PTR, const._CLASS_IN))
+    packet = out.packets()[0]
+    first = DNSIncoming(packet)
+    second = DNSIncoming(packet)
+    assert first.questions[0].name == "_hap._tcp.local."
+    first_labels = first.name_cache[12]
+    second_labels = second.name_cache[12]
+    assert first_labels[1] is second_labels[1]
+    assert first_labels[2] is second_labels[2]
+
+
+def test_lone_question_skips_name_cache():
+    """Test a query with a single question does not build a name cache."""
+    out = r.DNSOutgoing(const._FLAGS_QR_QUERY)
+    out.add_question(r.DNSQuestion("_hap._tcp.local.", const._TYPE_PTR, const._CLASS_IN))
+    parsed = DNSIncoming(out.packets()[0])
+    assert parsed.questions[0].name == "_hap._tcp.local."
+    assert parsed.name_cache is None
+
+
+def test_truncated_srv_record_is_skipped():
+    """Test an SRV record cut short by the end of the packet is skipped."""
+    packet = (
+        b"\x00\x00\x84\x00\x00\x00\x00\x02\x00\x00\x00\x00\x04test\x05local\x00\x00\x01\x80\x01"
+        b"\x00\x00\x00x\x00\x04\xc0\xa8\x01\x01\xc0\x0c\x00!\x80\x01\x00\x00\x00x\x00\x14\x00\x00\x00\x00"
+    )
+    parsed = DNSIncoming(packet)
+    assert parsed.valid is True
+    assert len(parsed.answers) == 1
+    assert parsed.answers[0].type == const._TYPE_A
+
+
+def test_unknown_record_type_name_is_not_decoded():
+    """Test records of unknown types are skipped without decoding their name."""
+    packet = (
+        b"\x00\x00\x84\x00\x00\x00\x00\x02\x00\x00\x00\x00\xc0\x18\x000\x00\x01\x00\x00\x00x\x00\x00"
+        b"\x04test\x05local\x00\x00\x01\x80\x01\x00\x00\x00x\x00\x04\xc0\xa8\x01\x01"
+    )
+    parsed = DNSIncoming(packet)
+    assert parsed.valid is True
+    assert len(parsed.answers) == 1
+    assert parsed.answers[0].name == "test.local."
+    assert 12 not in parsed.name_cache
+
+
+def test_unknown_record_type_name_pointer_beyond_packet():
+    """Test a pointer beyond the packet in the name of an unknown record type is rejected."""
+    packet = (
+        b"\x00\x00\x84\x00\x00\x00\x00\x02\x00\x00\x00\x00\xc0\xff\x000\x00\x01\x00\x00\x00x\x00\x00"
+        b"\x04test\x05local\x00\x00\x01\x80\x01\x00\x00\x00x\x00\x04\xc0\xa8\x01\x01"
+    )
+    parsed = DNSIncoming(packet)
+    assert parsed.valid is False
+    assert parsed.answers == []
+
+
+def test_unknown_record_type_name_unknown_compression_type():
+    """Test an unknown compression type in the name of an unknown record type is rejected."""
+    packet = (
+        b"\x00\x00\x84\x00\x00\x00\x00\x02\x00\x00\x00\x00\x80\x18\x000\x00\x01\x00\x00\x00x\x00\x00"
+        b"\x04test\x05local\x00\x00\x01\x80\x01\x00\x00\x00x\x00\x04\xc0\xa8\x01\x01"
+    )
+    parsed = DNSIncoming(packet)
+    assert parsed.valid is False
+    assert parsed.answers == []
+
+
+def test_parsed_aaaa_record_matches_constructed_record():
+    """Test an AAAA record parsed with a scope id hashes and compares like a constructed one."""
+    address = socket.inet_pton(socket.AF_INET6, "fe80::1")
+    out = r.DNSOutgoing(const._FLAGS_QR_RESPONSE | const._FLAGS_AA)
+    out.add_answer_at_time(
+        r.DNSAddress("host.local.", const._TYPE_AAAA, const._CLASS_IN, const._DNS_HOST_TTL, address), 0
+    )
+    parsed = r.DNSIncoming(out.packets()[0], scope_id=3)
+    record = r.DNSAddress(
+        "host.local.", const._TYPE_AAAA, const._CLASS_IN, const._DNS_HOST_TTL, address, scope_id=3
+    )
+    assert parsed.answers[0] == record
+    assert hash(parsed.answers[0]) == hash(record)
+
+
 def test_records_same_packet_share_fate():
     """Test records in the same packet all have the same created time."""
     out = r.DNSOutgoing(const._FLAGS_QR_QUERY | const._FLAGS_AA)
@@ -896,6 +1002,78 @@ def test_dns_compression_points_forward():
     assert answer in parsed.answers
 
 
+def test_dns_compression_nested_pointers_are_cached():
+    """Test names reached through a chain of compression pointers decode and share the name cache."""
+    out = r.DNSOutgoing(const._FLAGS_QR_RESPONSE | const._FLAGS_AA)
+    out.add_answer_at_time(
+        r.DNSPointer(
+            "_hap._tcp.local.",
+            const._TYPE_PTR,
+            const._CLASS_IN,
+            const._DNS_OTHER_TTL,
+            "dev._hap._tcp.local.",
+        ),
+        0,
+    )
+    for port in (80, 81):
+        out.add_answer_at_time(
+            r.DNSService(
+                "dev._hap._tcp.local.",
+                const._TYPE_SRV,
+                const._CLASS_IN | const._CLASS_UNIQUE,
+                const._DNS_HOST_TTL,
+                0,
+                0,
+                port,
+                "dev.local.",
+            ),
+            0,
+        )
+    parsed = r.DNSIncoming(out.packets()[0])
+    assert [answer.name for answer in parsed.answers] == [
+        "_hap._tcp.local.",
+        "dev._hap._tcp.local.",
+        "dev._hap._tcp.local.",
+    ]
+    assert cast(r.DNSPointer, parsed.answers[0]).alias == "dev._hap._tcp.local."
+    assert cast(r.DNSService, parsed.answers[1]).server == "dev.local."
+    assert ["_hap", "_tcp", "local"] in parsed.name_cache.values()
+    assert ["dev", "_hap", "_tcp", "local"] in parsed.name_cache.values()
+    # Both SRV names are a single pointer to the PTR alias and share its labels
+    srv_labels = [labels for labels in parsed.name_cache.values() if labels[0] == "dev" and len(labels) == 4]
+    assert len(srv_labels) == 3
+    assert srv_labels[0] is srv_labels[1] is srv_labels[2]
+
+
+def test_packet_too_short_for_section_counts(caplog):
+    """Test packets claiming more records than they can hold are rejected before parsing."""
+    packet = b"\x00\x00\x84\x00\x00\x01\xff\xff\x00\x00\x00\x00\x00\x00\x01\x00\x01"
+    parsed = r.DNSIncoming(packet, ("1.2.3.4", 5353))
+    assert parsed.valid is False
+    assert parsed.questions == []
+    assert parsed.answers == []
+    assert "too short for its section counts" in caplog.text
+
+
+def test_response_too_short_for_answer_count_has_no_answers():
+    """Test a response with an inflated answer count exposes no answers."""
+    out = r.DNSOutgoing(const._FLAGS_QR_RESPONSE | const._FLAGS_AA)
+    out.add_question(r.DNSQuestion("_hap._tcp.local.", const._TYPE_PTR, const._CLASS_IN))
+    out.add_answer_at_time(
+        r.DNSPointer(
+            "_hap._tcp.local.", const._TYPE_PTR, const._CLASS_IN, const._DNS_OTHER_TTL, "dev._hap._tcp.local."
+        ),
+        0,
+    )
+    packet = bytearray(out.packets()[0])
+    packet[7] = 9
+    parsed = r.DNSIncoming(bytes(packet))
+    assert parsed.valid is False
+    assert parsed.questions == []
+    assert parsed.answers == []
+    assert "n_ans=9" in repr(parsed)
+
+
 def test_dns_compression_points_to_itself():
     """Test our wire parser does not loop forever when a compression pointer points to itself."""
     packet = (
@@ -949,6 +1127,25 @@ def test_label_length_attack():
     assert len(parsed.answers) == 0
 
 
+def test_long_labels_exceed_max_name_length(caplog):
+    """Test a name of a few long labels over 253 chars is rejected by its exact length."""
+    name = b'\x3f' + b'a' * 63
+    packet = b'\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00' + name * 4 + b'\x00\x00\x01\x00\x01'
+    parsed = r.DNSIncoming(packet, ("2.4.5.6", 5353))
+    assert parsed.valid is False
+    assert parsed.questions == []
+    assert f"DNS name {'.'.join(['a' * 63] * 4)}. exceeds maximum length of 253" in caplog.text
+
+
+def test_label_count_exceeds_max_name_length(caplog):
+    """Test a name with more labels than can fit in 253 chars is rejected by its label count."""
+    packet = b'\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00' + b'\x01d' * 127 + b'\x00\x00\x01\x00\x01'
+    parsed = r.DNSIncoming(packet, ("2.4.5.7", 5353))
+    assert parsed.valid is False
+    assert parsed.questions == []
+    assert "DNS name with 127 labels exceeds maximum length of 253" in caplog.text
+
+
 def test_label_compression_attack():
     """Test our wire parser does not loop forever when exceeding the maximum number of labels."""
     packet = (